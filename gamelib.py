@@ -2,8 +2,10 @@
 The gamelib module defines abstract classes necessary for implementing simple
 games based on tkinter's canvas.
 """
+import time
 import tkinter as tk
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 
 class GameElement(ABC):
@@ -84,14 +86,19 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
     on update/render loop
     """
 
-    def __init__(self, parent, update_delay=33):
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, parent, update_delay=33, max_steps_per_frame=5):
         super().__init__(parent)
         self.__canvas = tk.Canvas(self)
         self.__canvas.pack(expand=True, fill="both")
         self.pack(expand=True, fill="both")
         self.__game_elements = []
         self.__update_delay = update_delay
+        self.__max_steps_per_frame = max_steps_per_frame
         self.__started = False
+        self.__last_time = 0.0
+        self.__lag = 0.0
+        self.__render_pending = False
         self.init_game()
 
     @abstractmethod
@@ -118,6 +125,21 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         element.create()
         self.__game_elements.append(element)
+        # the first animate() step draws the initial frame, and nothing
+        # should be drawn once the game is over
+        if self.is_started:
+            self.request_render()
+
+    def add_elements(self, elements: Iterable[GameElement]) -> None:
+        """
+        Add several GameElement objects to the game at once
+        """
+        elements = list(elements)
+        for element in elements:
+            element.create()
+        self.__game_elements.extend(elements)
+        if self.is_started:
+            self.request_render()
 
     def delete_element(self, element: GameElement) -> None:
         """
@@ -146,6 +168,9 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         if not self.__started:
             self.__started = True
+            # owe exactly one update step so the first frame behaves as before
+            self.__last_time = time.perf_counter()
+            self.__lag = self.__update_delay / 1000
             self.animate()
 
     def stop(self) -> None:
@@ -154,12 +179,54 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         self.__started = False
 
-    def animate(self):
+    def update_elements(self) -> None:
         """
-        Update and render all game's elements
+        Update internal states of all game's elements
         """
         for element in self.__game_elements:
             element.update()
+
+    def render_elements(self) -> None:
+        """
+        Render all game's elements with their current properties
+        """
+        for element in self.__game_elements:
             element.render()
+
+    def request_render(self) -> None:
+        """
+        Schedule all game's elements to be rendered once Tk becomes idle.
+        Requests made before that render happens are coalesced into it.
+        """
+        if not self.__render_pending:
+            self.__render_pending = True
+            self.after_idle(self.__render)
+
+    def __render(self) -> None:
+        self.__render_pending = False
+        self.render_elements()
+
+    def animate(self):
+        """
+        Update and render all game's elements.  Updates run at a fixed time
+        step of update_delay, catching up on any steps missed while Tk was
+        busy, so a slow frame delays drawing but not the simulation.  Frames
+        in which nothing was updated are not redrawn.  At most
+        max_steps_per_frame steps run per frame; beyond that the simulation
+        slows down instead of starving Tk of time to draw and handle input.
+        """
+        now = time.perf_counter()
+        self.__lag += now - self.__last_time
+        self.__last_time = now
+        step = self.__update_delay / 1000
+        steps = 0
+        while self.__started and self.__lag >= step:
+            if steps == self.__max_steps_per_frame:
+                self.__lag = 0.0
+                break
+            self.update_elements()
+            self.__lag -= step
+            steps += 1
+            self.request_render()
         if self.__started:
             self.after(self.__update_delay, self.animate)
@@ -1,13 +1,19 @@
 """
 The main module, responsible for creating a root window containing the game's
 main component.
+
+Set the TURTLE_PROFILE environment variable to run the game under cProfile;
+the statistics are written to turtle.prof when the window is closed.
 """
+import cProfile
+import os
 from typing import Final
 import tkinter as tk
 from turtle_adventure import TurtleAdventureGame
 
 SCREEN_WIDTH: Final = 800
 SCREEN_HEIGHT: Final = 500
+PROFILE_OUTPUT: Final = "turtle.prof"
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -15,5 +21,15 @@ if __name__ == "__main__":
     root.geometry(f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}")
     root.resizable(False, False) # games usually have fixed window size
     game = TurtleAdventureGame(root, SCREEN_WIDTH, SCREEN_HEIGHT, level=4)
-    game.start()
-    root.mainloop()
+    if os.environ.get("TURTLE_PROFILE"):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        game.start()
+        try:
+            root.mainloop()
+        finally:
+            profiler.disable()
+            profiler.dump_stats(PROFILE_OUTPUT)
+    else:
+        game.start()
+        root.mainloop()
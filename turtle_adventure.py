@@ -56,8 +56,9 @@ class Waypoint(TurtleGameElement):
             self.canvas.itemconfigure(self.__id2, state="normal")
             self.canvas.tag_raise(self.__id1)
             self.canvas.tag_raise(self.__id2)
-            self.canvas.coords(self.__id1, self.x - 10, self.y - 10, self.x + 10, self.y + 10)
-            self.canvas.coords(self.__id2, self.x - 10, self.y + 10, self.x + 10, self.y - 10)
+            x, y = self.x, self.y
+            self.canvas.coords(self.__id1, x - 10, y - 10, x + 10, y + 10)
+            self.canvas.coords(self.__id2, x - 10, y + 10, x + 10, y - 10)
         else:
             self.canvas.itemconfigure(self.__id1, state="hidden")
             self.canvas.itemconfigure(self.__id2, state="hidden")
@@ -89,10 +90,17 @@ class Home(TurtleGameElement):
     Represent the player's home.
     """
 
+    # pylint: disable=too-many-instance-attributes
     def __init__(self, game: "TurtleAdventureGame", pos: tuple[int, int], size: int):
         super().__init__(game)
         self.__id: int
         self.__size: int = size
+        self.__half: float = size / 2
+        # position the rectangle was last drawn at, valid once rendered;
+        # changing the size clears the flag
+        self.__rendered: bool = False
+        self.__rendered_x: float = 0
+        self.__rendered_y: float = 0
         x, y = pos
         self.x = x
         self.y = y
@@ -107,9 +115,12 @@ class Home(TurtleGameElement):
     @size.setter
     def size(self, val: int) -> None:
         self.__size = val
+        self.__half = val / 2
+        self.__rendered = False
 
     def create(self) -> None:
         self.__id = self.canvas.create_rectangle(0, 0, 0, 0, outline="brown", width=2)
+        self.__rendered = False
 
     def delete(self) -> None:
         self.canvas.delete(self.__id)
@@ -119,19 +130,22 @@ class Home(TurtleGameElement):
         pass
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
+        # homes rarely move or resize, so skip the canvas call unless they did
+        x, y = self.x, self.y
+        if self.__rendered and x == self.__rendered_x and y == self.__rendered_y:
+            return
+        self.__rendered = True
+        self.__rendered_x = x
+        self.__rendered_y = y
+        half = self.__half
+        self.canvas.coords(self.__id, x - half, y - half, x + half, y + half)
 
     def contains(self, x: float, y: float):
         """
         Check whether home contains the point (x, y).
         """
-        x1, x2 = self.x - self.size / 2, self.x + self.size / 2
-        y1, y2 = self.y - self.size / 2, self.y + self.size / 2
-        return x1 <= x <= x2 and y1 <= y <= y2
+        half = self.__half
+        return -half <= x - self.x <= half and -half <= y - self.y <= half
 
 
 class Player(TurtleGameElement):
@@ -146,6 +160,8 @@ class Player(TurtleGameElement):
         super().__init__(game)
         self.__speed: float = speed
         self.__turtle: RawTurtle = turtle
+        self.__x: float = 0
+        self.__y: float = 0
 
     def create(self) -> None:
         turtle = RawTurtle(self.canvas)
@@ -172,39 +188,50 @@ class Player(TurtleGameElement):
 
     def update(self) -> None:
         # check if player has arrived home
-        if self.game.home.contains(self.x, self.y):
+        if self.game.home.contains(self.__x, self.__y):
             self.game.game_over_win()
-        turtle = self.__turtle
         waypoint = self.game.waypoint
-        if self.game.waypoint.is_active:
-            turtle.setheading(turtle.towards(waypoint.x, waypoint.y))
-            turtle.forward(self.speed)
-            if turtle.distance(waypoint.x, waypoint.y) < self.speed:
+        if waypoint.is_active:
+            # walk toward the waypoint using the cached position rather than
+            # turtle.towards()/forward()/distance(), which each re-read it
+            dx = waypoint.x - self.__x
+            dy = waypoint.y - self.__y
+            distance = math.hypot(dx, dy)
+            if distance == 0:
+                waypoint.deactivate()
+                return
+            speed = self.speed
+            self.__turtle.setheading(math.degrees(math.atan2(dy, dx)))
+            self.__x += dx * speed / distance
+            self.__y += dy * speed / distance
+            # the step is along the line to the waypoint, so the remaining
+            # distance is |distance - speed|
+            if abs(distance - speed) < speed:
                 waypoint.deactivate()
 
     def render(self) -> None:
-        self.__turtle.goto(self.x, self.y)
+        self.__turtle.goto(self.__x, self.__y)
         self.__turtle.getscreen().update()
 
-    # override original property x's getter/setter to use turtle's methods
-    # instead
+    # override original property x's getter/setter to keep the position in
+    # plain floats; the turtle itself is moved only when rendered
     @property
     def x(self) -> float:
-        return self.__turtle.xcor()
+        return self.__x
 
     @x.setter
     def x(self, val: float) -> None:
-        self.__turtle.setx(val)
+        self.__x = val
 
-    # override original property y's getter/setter to use turtle's methods
-    # instead
+    # override original property y's getter/setter to keep the position in
+    # plain floats; the turtle itself is moved only when rendered
     @property
     def y(self) -> float:
-        return self.__turtle.ycor()
+        return self.__y
 
     @y.setter
     def y(self, val: float) -> None:
-        self.__turtle.sety(val)
+        self.__y = val
 
 
 class Enemy(TurtleGameElement):
@@ -212,13 +239,23 @@ class Enemy(TurtleGameElement):
     Define an abstract enemy for the Turtle's adventure game
     """
 
+    # whether the enemy's size stays the same, so it can be redrawn by moving
+    # its canvas item instead of resetting the item's coordinates
+    fixed_size: bool = True
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game)
         self.__size = size
+        self.__half_size = size / 2
         self.__color = color
+        self.__id: int | None = None
+        # position the canvas item was last drawn at, valid once rendered
+        self.__rendered: bool = False
+        self.__rendered_x: float = 0
+        self.__rendered_y: float = 0
 
     @property
     def size(self) -> float:
@@ -227,6 +264,14 @@ class Enemy(TurtleGameElement):
         """
         return self.__size
 
+    @property
+    def half_size(self) -> float:
+        """
+        Get half the size of the enemy, computed once since the size of most
+        enemies never changes
+        """
+        return self.__half_size
+
     @property
     def color(self) -> str:
         """
@@ -234,15 +279,54 @@ class Enemy(TurtleGameElement):
         """
         return self.__color
 
-    def hits_player(self):
+    @property
+    def item_id(self) -> int | None:
+        """
+        Get or set the id of the canvas item representing the enemy
+        """
+        return self.__id
+
+    @item_id.setter
+    def item_id(self, val: int) -> None:
+        self.__id = val
+
+    def bbox(self) -> tuple[float, float, float, float]:
         """
-        Check whether the enemy is hitting the player
+        Give the bounding box (x1, y1, x2, y2) of the enemy's canvas item
         """
-        return (
-                (self.x - self.size / 2 < self.game.player.x < self.x + self.size / 2)
-                and
-                (self.y - self.size / 2 < self.game.player.y < self.y + self.size / 2)
-        )
+        x, y, half = self.x, self.y, self.half_size
+        return x - half, y - half, x + half, y + half
+
+    def render_command(self, canvas_path: str) -> str:
+        """
+        Give the Tcl command that brings the enemy's canvas item up to date.
+        Enemies of a fixed size are shifted by the distance moved since the
+        last call; others have their whole bounding box reset.
+        """
+        x, y = self.x, self.y
+        if self.fixed_size and self.__rendered:
+            dx, dy = x - self.__rendered_x, y - self.__rendered_y
+            command = f"{canvas_path} move {self.item_id} {dx!r} {dy!r}"
+        else:
+            x1, y1, x2, y2 = self.bbox()
+            command = f"{canvas_path} coords {self.item_id} {x1:f} {y1:f} {x2:f} {y2:f}"
+        self.__rendered = True
+        self.__rendered_x = x
+        self.__rendered_y = y
+        return command
+
+    def render(self) -> None:
+        # enemies are drawn all at once by TurtleAdventureGame.render_all()
+        pass
+
+    def hits_player(self, player_x: float, player_y: float) -> bool:
+        """
+        Check whether the enemy is hitting the player at (player_x, player_y)
+        """
+        # compare offsets from the center against the half size, which needs
+        # one size lookup instead of four edge computations
+        half = self.half_size
+        return abs(player_x - self.x) < half and abs(player_y - self.y) < half
 
 
 class DemoEnemy(Enemy):
@@ -250,28 +334,12 @@ class DemoEnemy(Enemy):
     Demo enemy
     """
 
-    def __init__(self,
-                 game: "TurtleAdventureGame",
-                 size: int,
-                 color: str):
-        super().__init__(game, size, color)
-        self.__id = None
-
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
+        self.item_id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
 
     def update(self) -> None:
         self.x += 5
         self.y += 5
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
 
     def delete(self) -> None:
         pass
@@ -286,13 +354,12 @@ class RandomWalkEnemy(Enemy):
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
         self.__state_x = random.choice([self.moving_right, self.moving_left])
         self.__state_y = random.choice([self.moving_up, self.moving_down])
         self.speed = 3
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
+        self.item_id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
 
     def move_to(self, x, y):
         self.x = x
@@ -300,7 +367,7 @@ class RandomWalkEnemy(Enemy):
 
     def moving_up(self):
         self.move_to(self.x, self.y + self.speed)
-        if self.y > self.canvas.winfo_height():
+        if self.y > self.game.screen_height:
             self.__state_y = self.moving_down
 
     def moving_down(self):
@@ -310,7 +377,7 @@ class RandomWalkEnemy(Enemy):
 
     def moving_right(self):
         self.move_to(self.x + self.speed, self.y)
-        if self.x > self.canvas.winfo_width():
+        if self.x > self.game.screen_width:
             self.__state_x = self.moving_left
 
     def moving_left(self):
@@ -318,21 +385,18 @@ class RandomWalkEnemy(Enemy):
         if self.x < 0:
             self.__state_x = self.moving_right
 
-    def render(self):
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size,
-                           self.y + self.size)
+    def bbox(self) -> tuple[float, float, float, float]:
+        return (self.x - self.half_size,
+                self.y - self.half_size,
+                self.x + self.size,
+                self.y + self.size)
 
     def update(self):
         self.__state_x()
         self.__state_y()
-        if self.hits_player():
-            self.game.game_over_lose()
 
     def delete(self):
-        self.canvas.delete(self.__id)
+        self.canvas.delete(self.item_id)
 
 
 class ChasingEnemy(Enemy):
@@ -344,28 +408,26 @@ class ChasingEnemy(Enemy):
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
         self.speed = 3
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
+        self.item_id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
 
     def update(self) -> None:
-        angle = math.atan2(self.game.player.y - self.y, self.game.player.x - self.x)
-        self.x += self.speed * math.cos(angle)
-        self.y += self.speed * math.sin(angle)
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
+        player_x, player_y = self.game.player_pos
+        dx = player_x - self.x
+        dy = player_y - self.y
+        dist_sq = dx * dx + dy * dy
+        if dist_sq < 1e-9:
+            # already on top of the player; there is no direction to move in
+            return
+        # step along the unit vector toward the player; no trig needed
+        k = self.speed / math.sqrt(dist_sq)
+        self.x += dx * k
+        self.y += dy * k
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.canvas.delete(self.item_id)
 
 
 class FencingEnemy(Enemy):
@@ -377,9 +439,14 @@ class FencingEnemy(Enemy):
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
         self.speed = 5
-        self.directions = ["right", "down", "left", "up"]
+        # one (dx, dy, along_x, sign) entry per direction: right, down, left
+        # and up; the enemy turns once sign * (its offset from home along the
+        # axis it moves on) reaches distance_from_home
+        self.moves = ((self.speed, 0, True, 1),
+                      (0, self.speed, False, 1),
+                      (-self.speed, 0, True, -1),
+                      (0, -self.speed, False, -1))
         self.current_direction_index = 0
         self.distance_from_home = 50
         self.x = self.game.home.x + self.distance_from_home
@@ -387,38 +454,19 @@ class FencingEnemy(Enemy):
         self.update()
 
     def update(self):
-        direction = self.directions[self.current_direction_index]
-        if direction == "right":
-            self.x += self.speed
-            if self.x >= self.game.home.x + self.distance_from_home:
-                self.current_direction_index = (self.current_direction_index + 1) % 4
-        elif direction == "down":
-            self.y += self.speed
-            if self.y >= self.game.home.y + self.distance_from_home:
-                self.current_direction_index = (self.current_direction_index + 1) % 4
-        elif direction == "left":
-            self.x -= self.speed
-            if self.x <= self.game.home.x - self.distance_from_home:
-                self.current_direction_index = (self.current_direction_index + 1) % 4
-        elif direction == "up":
-            self.y -= self.speed
-            if self.y <= self.game.home.y - self.distance_from_home:
-                self.current_direction_index = (self.current_direction_index + 1) % 4
-        if self.hits_player():
-            self.game.game_over_lose()
+        dx, dy, along_x, sign = self.moves[self.current_direction_index]
+        self.x += dx
+        self.y += dy
+        home = self.game.home
+        offset = self.x - home.x if along_x else self.y - home.y
+        if sign * offset >= self.distance_from_home:
+            self.current_direction_index = (self.current_direction_index + 1) & 3
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
+        self.item_id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.canvas.delete(self.item_id)
 
 
 class BossEnemy(Enemy):
@@ -426,52 +474,52 @@ class BossEnemy(Enemy):
     Enemy will chase us but will get faster and bigger every second and with idea to generate multiple home with the
     fake home too
     """
+    fixed_size = False
+
     @property
     def size(self):
         return self._size
 
+    @property
+    def half_size(self) -> float:
+        return self._size / 2
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
         self.size = size
         self.num_fake_homes = 5
         self.speed = 3
         self.growth_rate = 0.7
 
     def update(self) -> None:
-        angle = math.atan2(self.game.player.y - self.y, self.game.player.x - self.x)
-        self.x += self.speed * math.cos(angle)
-        self.y += self.speed * math.sin(angle)
+        player_x, player_y = self.game.player_pos
+        dx = player_x - self.x
+        dy = player_y - self.y
+        dist_sq = dx * dx + dy * dy
+        if dist_sq >= 1e-9:
+            # step along the unit vector toward the player; no trig needed
+            k = self.speed / math.sqrt(dist_sq)
+            self.x += dx * k
+            self.y += dy * k
         self.size += self.growth_rate
         self.speed += 0.001
-        if self.hits_player():
-            self.game.game_over_lose()
 
     def generate_fake_homes(self):
-        canvas_width = self.game.canvas.winfo_width()
-        canvas_height = self.game.canvas.winfo_height()
-
-        for _ in range(self.num_fake_homes):
-            fake_home_x = random.randint(0, canvas_width)
-            fake_home_y = random.randint(0, canvas_height)
-            fake_home = Home(self.game, (fake_home_x, fake_home_y), 20)
-            self.game.add_element(fake_home)
+        width = self.game.screen_width + 1
+        height = self.game.screen_height + 1
+        rand = random.random
+        self.game.add_elements(
+            Home(self.game, (int(rand() * width), int(rand() * height)), 20)
+            for _ in range(self.num_fake_homes))
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill="black")
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
+        self.item_id = self.canvas.create_oval(0, 0, 0, 0, fill="black")
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.canvas.delete(self.item_id)
 
     @size.setter
     def size(self, value):
@@ -487,6 +535,14 @@ class EnemyGenerator:
     def __init__(self, game: "TurtleAdventureGame", level: int):
         self.__game: TurtleAdventureGame = game
         self.__level: int = level
+        # everything that depends only on the level is worked out once here
+        # rather than on every spawn
+        self.__kind: int = level % 4
+        # to make sure that the enemy will not spawn too close to the player
+        min_distance = max(300 - (level * 5), 100)
+        self.__min_distance_sq: int = min_distance * min_distance
+        # the more level you put the harder it is
+        self.__spawn_delay: int = max(200, 1000 - level * 10)
         self.create_enemy()
 
     @property
@@ -507,9 +563,7 @@ class EnemyGenerator:
         """
         Create a new enemy, possibly based on the game level
         """
-        canvas_width = self.game.canvas.winfo_width()
-        canvas_height = self.game.canvas.winfo_height()
-        level_mod = self.level % 4
+        level_mod = self.__kind
         if level_mod == 1:
             new_enemy = RandomWalkEnemy(self.__game, 20, "green")
         elif level_mod == 2:
@@ -518,30 +572,32 @@ class EnemyGenerator:
             new_enemy = FencingEnemy(self.__game, 20, "blue")
         else:
             new_enemy = BossEnemy(self.__game, 20, "black")
-            new_enemy.x = random.randint(0, canvas_width)
-            new_enemy.y = random.randint(0, canvas_height)
             new_enemy.generate_fake_homes()
 
         player_x = self.game.player.x
         player_y = self.game.player.y
-        # to make sure that the enemy will not spawn too close to the player
-        min_distance = max(300 - (self.level * 5), 100)
+        min_distance_sq = self.__min_distance_sq
         if level_mod == 3:
             random_x = self.game.home.x + 50
             random_y = self.game.home.y + 50
         else:
+            # int(random() * n) is a much cheaper uniform roll than randint()
+            width = self.game.screen_width + 1
+            height = self.game.screen_height + 1
+            rand = random.random
             while True:
-                random_x = random.randint(0, canvas_width)
-                random_y = random.randint(0, canvas_height)
-                distance_to_player = ((random_x - player_x) ** 2 + (random_y - player_y) ** 2) ** 0.5
-                if distance_to_player >= min_distance:
+                random_x = int(rand() * width)
+                random_y = int(rand() * height)
+                dx = random_x - player_x
+                dy = random_y - player_y
+                # compare squared distances so no square root is needed
+                if dx * dx + dy * dy >= min_distance_sq:
                     break
 
         new_enemy.x = random_x
         new_enemy.y = random_y
         self.game.add_enemy(new_enemy)
-        # the more level you put the harder it is
-        self.game.after(max(200, 1000 - self.level * 10), self.create_enemy)
+        self.game.after(self.__spawn_delay, self.create_enemy)
 
 
 class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
@@ -557,6 +613,7 @@ class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
         self.waypoint: Waypoint
         self.player: Player
         self.home: Home
+        self.player_pos: tuple[float, float] = (0, 0)
         self.enemies: list[Enemy] = []
         self.enemy_generator: EnemyGenerator
         super().__init__(parent)
@@ -584,8 +641,46 @@ class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
         """
         Add a new enemy into the current game
         """
+        # enemies are kept out of the generic element list so that
+        # step_enemies() can update and check them in a single pass
+        enemy.create()
         self.enemies.append(enemy)
-        self.add_element(enemy)
+        if self.is_started:
+            self.request_render()
+
+    def update_elements(self) -> None:
+        super().update_elements()
+        self.step_enemies()
+
+    def render_elements(self) -> None:
+        super().render_elements()
+        self.render_all()
+
+    def step_enemies(self) -> None:
+        """
+        Update all enemies and check them against the player in one pass,
+        losing the game when any of them hits
+        """
+        # snapshot the player's position once per tick for all enemies
+        self.player_pos = player_x, player_y = (self.player.x, self.player.y)
+        hit = False
+        for enemy in self.enemies:
+            enemy.update()
+            if not hit and enemy.hits_player(player_x, player_y):
+                hit = True
+        if hit:
+            self.game_over_lose()
+
+    def render_all(self) -> None:
+        """
+        Render all enemies using a single Tcl script, rather than making one
+        canvas.coords() round-trip per enemy
+        """
+        if not self.enemies:
+            return
+        path = str(self.canvas)
+        script = "\n".join([enemy.render_command(path) for enemy in self.enemies])
+        self.canvas.tk.eval(script)
 
     def game_over_win(self) -> None:
         """